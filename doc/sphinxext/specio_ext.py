@@ -1,20 +1,27 @@
 """ Invoke various functionality for specio docs.
 """
 
+import io
 import os
 
 import specio
 
 THIS_DIR = os.path.dirname(os.path.abspath(__file__))
 DOC_DIR = os.path.join(THIS_DIR, '..')
+# the generated files are flat names, a prefix is enough to locate them
+_DOC_DIR_PREFIX = os.path.join(DOC_DIR, '')
 
 
-files_to_remove = []
+files_to_write = []
 
 
 def setup(app):
     init()
-    app.connect('build-finished', clean)
+    flush_all()
+    # The generated files are written by ``flush_all`` before sphinx starts
+    # reading, so the extension does not prevent parallel builds (-j).
+    return {'parallel_read_safe': True,
+            'parallel_write_safe': True}
 
 
 def init():
@@ -30,17 +37,29 @@ def init():
         func()
 
 
-def clean(app, *args):
-    for fname in files_to_remove:
-        filename = os.path.join(DOC_DIR, fname)
-        if os.path.isfile(filename):
-            os.remove(filename)
+def _write(fname, text):
+    files_to_write.append((fname, text.encode('utf-8')))
 
 
-def _write(fname, text):
-    files_to_remove.append(fname)
-    with open(os.path.join(DOC_DIR, fname), 'wb') as f:
-        f.write(text.encode('utf-8'))
+def flush_all():
+    """Write to disk all the files queued by ``_write``.
+
+    The generated files are kept between builds. A file is only written when
+    its content changed, so that its modification time is preserved and
+    sphinx does not read it again during an incremental build.
+
+    """
+    for fname, content in files_to_write:
+        filename = _DOC_DIR_PREFIX + fname
+        try:
+            with open(filename, 'rb') as f:
+                if f.read() == content:
+                    continue
+        except IOError:
+            pass
+        with open(filename, 'wb', buffering=1 << 20) as f:
+            f.write(content)
+    del files_to_write[:]
 
 
 ##
@@ -90,11 +109,11 @@ def prepare_core_docs():
     # Write summaries
     classes.sort()
     functions.sort()
-    extradocs = '\nFunctions: '
-    extradocs += ', '.join([':func:`.%s`' % n for n in functions])
-    extradocs += '\n\nClasses: '
-    extradocs += ', '.join([':class:`.%s`' % n for n in classes])
-    extradocs += '\n\n----\n'
+    extradocs = ''.join(['\nFunctions: ',
+                         ', '.join([':func:`.%s`' % n for n in functions]),
+                         '\n\nClasses: ',
+                         ', '.join([':class:`.%s`' % n for n in classes]),
+                         '\n\n----\n'])
 
     # Update
     if D['__doc__'] is None:
@@ -110,20 +129,33 @@ def create_plugin_docs():
 
     # Build main plugin dir
     title = "Creating specio plugins"
-    text = '%s\n%s\n\n' % (title, '=' * len(title))
-
-    text += '.. automodule:: specio.plugins\n\n'
+    parts = ['%s\n%s\n\n' % (title, '=' * len(title)),
+             '.. automodule:: specio.plugins\n\n']
 
     # Insert code from example plugin
-    text += 'Example / template plugin\n-------------------------\n\n'
-    text += ".. code-block:: python\n    :linenos:\n\n"
+    parts.append('Example / template plugin\n-------------------------\n\n')
+    parts.append(".. code-block:: python\n    :linenos:\n\n")
     filename = specio.plugins.example.__file__.replace('.pyc', '.py')
-    code = open(filename, 'rb').read().decode('utf-8')
-    code = '\n'.join(['    ' + line.rstrip() for line in code.splitlines()])
-    text += code
+    with io.open(filename, encoding='utf-8') as f:
+        code = f.read()
+    lines = ['    ' + line.rstrip() for line in code.splitlines()]
+    parts.append('\n'.join(lines))
 
     # Write
-    _write('plugins.rst', text)
+    _write('plugins.rst', ''.join(parts))
+
+
+_FORMATS_CACHE = None
+
+
+def _get_format_records():
+    """Collect once the information of the registered formats."""
+    global _FORMATS_CACHE
+    if _FORMATS_CACHE is None:
+        _FORMATS_CACHE = tuple((f.name, f.description, tuple(f.extensions),
+                                f.__doc__)
+                               for f in specio.formats)
+    return _FORMATS_CACHE
 
 
 format_doc_text = """
@@ -142,43 +174,42 @@ def create_format_docs():
 
     # Build main plugin dir
     title = "Docs for specio formats"
-    text = '%s\n%s\n%s\n\n' % ('=' * len(title), title, '=' * len(title))
+    parts = ['%s\n%s\n%s\n\n' % ('=' * len(title), title, '=' * len(title)),
+             format_doc_text]
 
-    text += format_doc_text
+    fmts = _get_format_records()
 
     # Get bullet list of all formats
     ss = ['\n']
     subs = []
-    for format in specio.formats:
-        s = '  * :ref:`%s <%s>` - %s' % (format.name,
-                                         format.name,
-                                         format.description)
+    for name, description, _, _ in fmts:
+        s = '  * :ref:`%s <%s>` - %s' % (name, name, description)
         subs.append(s)
     if subs:
         ss.extend(subs)
         ss.append('')
 
-    text += '\n'.join(ss) + '\n\n'
-    _write('formats.rst', text)
+    parts.append('\n'.join(ss))
+    parts.append('\n\n')
+    _write('formats.rst', ''.join(parts))
 
     # Get more docs for each format
-    for format in specio.formats:
+    for name, description, extensions, doc in fmts:
 
-        title = '%s %s' % (format.name, format.description)
-        ext = ', '.join(['``%s``' % e for e in format.extensions])
+        title = '%s %s' % (name, description)
+        ext = ', '.join(['``%s``' % e for e in extensions])
         ext = ext or 'None'
-        #
-        text = ':orphan:\n\n'
-        text += '.. _%s:\n\n' % format.name
-        text += '%s\n%s\n\n' % (title, '='*len(title))
-        #
-        text += 'Extensions: %s\n\n' % ext
-        docs = '    ' + format.__doc__.lstrip()
+        docs = '    ' + doc.lstrip()
         docs = '\n'.join([x[4:].rstrip() for x in docs.splitlines()])
         #
-        text += docs + '\n\n'
+        parts = [':orphan:\n\n',
+                 '.. _%s:\n\n' % name,
+                 '%s\n%s\n\n' % (title, '=' * len(title)),
+                 'Extensions: %s\n\n' % ext,
+                 docs,
+                 '\n\n']
 
         # members = '\n  :members:\n\n'
-        # text += '.. autoclass:: %s.Reader%s' % (format.__module__, members)
-        # text += '.. autoclass:: %s.Writer%s' % (format.__module__, members)
-        _write('format_%s.rst' % format.name.lower(), text)
+        # parts.append('.. autoclass:: %s.Reader%s' % (format.__module__,
+        #                                              members))
+        _write('format_%s.rst' % name.lower(), ''.join(parts))
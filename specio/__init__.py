@@ -9,6 +9,7 @@ formats = FormatManager()
 from .core.functions import help
 from .core.functions import get_reader
 from .core.functions import specread
+from .core.functions import specread_many
 
 # Load all the plugins
 from . import plugins
@@ -20,6 +21,7 @@ __all__ = ['formats',
            'help',
            'get_reader',
            'specread',
+           'specread_many',
            'plugins',
            '__version__']
 
@@ -2,12 +2,38 @@ from __future__ import print_function
 
 import os
 
-import numpy as np
-
-from .core.functions import _validate_filenames
+from .core.functions import _effective_n_jobs, _validate_filenames
 from . import specread
 
 
+def _to_csv(spectrum, filenames, n_jobs=1):
+    """Export each spectrum to the CSV file of the same index."""
+    n_jobs = min(_effective_n_jobs(n_jobs), len(filenames))
+    if n_jobs <= 1:
+        for sp, filename in zip(spectrum, filenames):
+            sp.to_csv(filename)
+        return
+
+    from multiprocessing.pool import ThreadPool
+    pool = ThreadPool(n_jobs)
+    try:
+        pool.map(lambda args: args[0].to_csv(args[1]),
+                 zip(spectrum, filenames))
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _n_jobs(value):
+    """Parse the number of threads given on the command line."""
+    import argparse
+    n_jobs = int(value)
+    if n_jobs == 0:
+        raise argparse.ArgumentTypeError(
+            'the number of jobs cannot be 0, use 1 to run serially')
+    return n_jobs
+
+
 def main():
     import argparse
     parser = argparse.ArgumentParser(
@@ -35,29 +61,36 @@ def main():
         help='Tolerance to merge spectrum when their wavelength are slightly '
              'different (default=1e-5)')
 
+    convert_parser.add_argument(
+        '--jobs', '-j', type=_n_jobs, default=1,
+        help='The number of threads used to read and export the files. If '
+             'negative, use as many threads as CPUs (default=1)')
+
     args = parser.parse_args()
 
     if args.sub == 'convert':
         filenames = _validate_filenames(args.filepath)
         tol_wavelength = args.tolerance[0]
-        spectrum = specread(filenames, tol_wavelength=tol_wavelength)
+        spectrum = specread(filenames, tol_wavelength=tol_wavelength,
+                            n_jobs=args.jobs)
 
         # case that we could not merge the spectra together
         if isinstance(spectrum, list):
             if args.output:
                 # remove the extension in case that the user gave one
                 output_basename, _ = os.path.splitext(args.output[0])
-                for idx, sp in enumerate(spectrum):
-                    sp.to_csv(output_basename + '_{}.csv'.format(idx))
+                output_path = [output_basename + '_{}.csv'.format(idx)
+                               for idx in range(len(spectrum))]
             else:
                 output_basename = [sp.meta['filename'] for sp in spectrum]
-                if np.unique(output_basename).size == len(output_basename):
-                    for name, sp in zip(output_basename, spectrum):
-                        sp.to_csv(os.path.splitext(name)[0] + '.csv')
+                if len(set(output_basename)) == len(output_basename):
+                    output_path = [os.path.splitext(name)[0] + '.csv'
+                                   for name in output_basename]
                 else:
                     basename = os.path.splitext(output_basename[0])[0]
-                    for idx, sp in enumerate(spectrum):
-                        sp.to_csv(basename + '_{}.csv'.format(idx))
+                    output_path = [basename + '_{}.csv'.format(idx)
+                                   for idx in range(len(spectrum))]
+            _to_csv(spectrum, output_path, n_jobs=args.jobs)
 
         # case that we have a single spectrum
         else:
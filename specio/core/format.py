@@ -7,11 +7,19 @@
 from __future__ import print_function
 
 import os
-from collections import Iterable
 from warnings import warn
+
+import numpy as np
 from six import string_types
+from six.moves import intern
+
+try:
+    from collections.abc import Iterable
+except ImportError:  # pragma: no cover - python 2
+    from collections import Iterable
 
 from .exceptions import CannotReadSpectraError
+from .request import Request
 from .util import Spectrum
 
 
@@ -46,20 +54,33 @@ class Format(object):
 
     """
 
+    # subclasses not declaring __slots__ still get an instance __dict__
+    __slots__ = ('_name', '_name_prefix', '_description', '_extensions',
+                 '_doc', '__weakref__')
+
     def __init__(self, name, description, extensions=None):
         self._name = name.upper()
+        # part of the name before the last dash, used for lookups by name
+        self._name_prefix = self._name.rsplit('-', 1)[0]
         self._description = description
+        self._doc = None  # built on first access
 
         # Store extensions, do some effort to normalize them.
         # They are stored as a list of lowercase strings without leading dots.
         if extensions is None:
             extensions = []
         elif isinstance(extensions, string_types):
-            extensions = extensions.replace(',', ' ').split(' ')
+            extensions = extensions.replace(',', ' ').split()
 
         if isinstance(extensions, (tuple, list)):
-            self._extensions = tuple(['.' + e.strip('.').lower()
-                                      for e in extensions if e])
+            # drop the duplicates while keeping the order of the extensions
+            normalized_extensions = []
+            for e in extensions:
+                if e:
+                    e = intern('.' + e.strip('.').lower())
+                    if e not in normalized_extensions:
+                        normalized_extensions.append(e)
+            self._extensions = tuple(normalized_extensions)
         else:
             raise ValueError('Invalid value for extensions given.')
 
@@ -74,8 +95,11 @@ class Format(object):
         """Format documention."""
         # Our docsring is assumed to be indented by four spaces. The
         # first line needs special attention.
-        return '%s - %s\n\n    %s\n' % (self.name, self.description,
-                                        self.__doc__.strip())
+        if self._doc is None:
+            doc = self.__doc__.strip()
+            self._doc = '%s - %s\n\n    %s\n' % (self.name, self.description,
+                                                 doc)
+        return self._doc
 
     @property
     def name(self):
@@ -156,13 +180,21 @@ class Format(object):
 
         """
 
+        # Plugins which cannot cheaply know the number of spectra can set
+        # this flag: iter_data will then read until an IndexError is raised
+        # instead of calling get_length.
+        _streaming = False
+
+        __slots__ = ('__closed', '_BaseReader_last_index', '_format',
+                     '_request', '__weakref__')
+
         def __init__(self, format, request):
             self.__closed = False
             self._BaseReader_last_index = -1
             self._format = format
             self._request = request
             # Open the reader
-            self._open(**self.request.kwargs.copy())
+            self._open(**request.kwargs)
 
         @property
         def format(self):
@@ -245,6 +277,39 @@ class Format(object):
             """
             return self.get_data(self._BaseReader_last_index + 1, **kwargs)
 
+        def get_all_data(self, **kwargs):
+            """Read all the spectra from the file in a single ``Spectrum``.
+
+            This is the preferred way to load all the spectra at once: when
+            the plugin already holds a 2D ``Spectrum``, it is returned as is;
+            a list of spectra sharing the same wavelength is stacked once.
+
+            Parameters
+            ----------
+            kwargs: dict
+                Additional arguments which might used by the given format.
+
+            Returns
+            -------
+            spectrum : Spectrum
+                A ``Spectrum`` instance containing the data and metadata. When
+                several spectra are stacked, the meta data is a tuple of dict.
+
+            """
+            data = self.get_data(index=None, **kwargs)
+            if isinstance(data, Spectrum):
+                return data
+
+            wavelength = data[0].wavelength
+            for spectrum in data[1:]:
+                if not np.array_equal(spectrum.wavelength, wavelength):
+                    raise ValueError("The spectra do not share the same"
+                                     " wavelength and cannot be stacked."
+                                     " Use iter_data instead.")
+            amplitudes = np.stack([spectrum.amplitudes for spectrum in data])
+            return Spectrum(amplitudes, wavelength,
+                            tuple(spectrum.meta for spectrum in data))
+
         def get_meta_data(self, index=None):
             """Read the meta data for a given spectrum.
 
@@ -288,7 +353,32 @@ class Format(object):
 
             """
             self._checkClosed()
-            i, n = 0, self.get_length()
+            i = 0
+            if self._streaming:
+                # read until the plugin signals the end of the series
+                while True:
+                    try:
+                        spectra = self._get_data(i)
+                    except (IndexError, CannotReadSpectraError):
+                        return
+                    yield spectra
+                    i += 1
+
+            n = self.get_length()
+
+            # Fast path: the reader relies on the default _get_data and holds
+            # a 2D Spectrum. Iterating over the rows yields views directly.
+            data = getattr(self, '_data', None)
+            get_data = type(self)._get_data
+            if (getattr(get_data, '__func__', get_data) is _BASE_GET_DATA and
+                    isinstance(data, Spectrum) and
+                    data.amplitudes.ndim == 2 and
+                    data.amplitudes.shape[0] == n):
+                wavelength, meta = data.wavelength, data.meta
+                for amplitudes in data.amplitudes:
+                    yield Spectrum(amplitudes, wavelength, meta)
+                return
+
             while i < n:
                 try:
                     spectra = self._get_data(i)
@@ -319,8 +409,11 @@ class Format(object):
                 self.close()
 
         def __del__(self):
+            # The plugins release their resources in _close which needs the
+            # instance itself: a weakref finalizer cannot be used here.
             try:
-                self.close()
+                if not self.__closed:
+                    self.close()
             except Exception:
                 pass  # Remove noise when called during interpreter shutdown
 
@@ -415,10 +508,17 @@ class Format(object):
             given index, or to the file's (global) meta data if index is None.
 
             """
-            if index is not None and isinstance(self._data.meta, Iterable):
-                return self._data.meta[index]
+            meta = self._data.meta
+            # a dict is iterable but is the meta data of the whole file
+            if (index is not None and not isinstance(meta, dict) and
+                    isinstance(meta, Iterable)):
+                return meta[index]
             else:
-                return self._data.meta
+                return meta
+
+
+# used by Reader.iter_data to detect plugins keeping the default _get_data
+_BASE_GET_DATA = Format.Reader.__dict__['_get_data']
 
 
 class FormatManager(object):
@@ -434,7 +534,13 @@ class FormatManager(object):
     """
     def __init__(self):
         self._formats = []
-        self._formats_sorted = []
+        # the names are unique: used for the membership tests
+        self._formats_by_name = {}
+        # kept as a tuple, rebuilt on each change: iterating over it is safe
+        # while formats get registered
+        self._formats_sorted = ()
+        self._extension_index = None
+        self._name_index = None
 
     def __repr__(self):
         return '<specio.FormatManager with %i registered formats>' % len(self)
@@ -461,10 +567,11 @@ class FormatManager(object):
         if not name:
             raise ValueError('No format matches the empty string.')
 
-        # Test if name is existing file
-        if os.path.isfile(name):
-            from . import Request
-            format = self.search_read_format(Request(name, '?'))
+        # Test if name is existing file. Format names and bare extensions
+        # contain neither a dot nor a separator: skip the system call.
+        if (('.' in name or os.sep in name or '/' in name) and
+                os.path.isfile(name)):
+            format = self.search_read_format(Request(name))
             if format is not None:
                 return format
 
@@ -473,27 +580,89 @@ class FormatManager(object):
             e1, e2 = os.path.splitext(name.lower())
             name = e2 or e1
             # Search for format that supports this extension
-            for format in self:
-                if name in format.extensions:
-                    return format
+            formats = self._get_extension_index().get(name)
+            if formats:
+                return formats[0]
         else:
             # Look for name
             name = name.upper()
-            for format in self:
-                if name == format.name:
-                    return format
-            for format in self:
-                if name == format.name.rsplit('-', 1)[0]:
-                    return format
-            else:
-                # Maybe the user meant to specify an extension
-                return self['.' + name.lower()]
+            format = self._get_name_index().get(name)
+            if format is not None:
+                return format
+            # Maybe the user meant to specify an extension
+            name = '.' + name.lower()
+            formats = self._get_extension_index().get(name)
+            if formats:
+                return formats[0]
 
         # Nothing found ...
         raise IndexError('No format known by name %s.' % name)
 
-    def _sorter(val, name):
-        return - ((val.name == name) + (val.name.endswith(name)))
+    def _get_extension_index(self):
+        """Map each extension to the formats supporting it.
+
+        The formats of each extension are listed in the sorted order. The
+        index is built lazily and discarded by :meth:`clear_cache`.
+
+        """
+        if self._extension_index is None:
+            extension_index = {}
+            for format in self:
+                for ext in format.extensions:
+                    extension_index.setdefault(ext, []).append(format)
+            self._extension_index = extension_index
+        return self._extension_index
+
+    def _get_name_index(self):
+        """Map the names of the formats to the formats.
+
+        A format is also indexed by the part of its name before the last
+        dash, the full names taking precedence. The index is built lazily and
+        discarded by :meth:`clear_cache`.
+
+        """
+        if self._name_index is None:
+            name_index = {}
+            for format in self:
+                name_index.setdefault(format.name, format)
+            for format in self:
+                name_index.setdefault(format._name_prefix, format)
+            self._name_index = name_index
+        return self._name_index
+
+    def _select_formats(self, filename):
+        """Select the formats having an extension ending the filename.
+
+        Parameters
+        ----------
+        filename : str
+            The lower case filename.
+
+        Returns
+        -------
+        selected_formats : list of specio.Format
+            The selected formats, in the sorted order.
+
+        """
+        extension_index = self._get_extension_index()
+        # look up every suffix starting with a dot; the extensions do not
+        # contain any separator so the directories need not be scanned
+        filename = os.path.basename(filename)
+        selected_formats = []
+        n_matches = 0
+        start = filename.find('.')
+        while start != -1:
+            formats = extension_index.get(filename[start:])
+            if formats:
+                selected_formats.extend(formats)
+                n_matches += 1
+            start = filename.find('.', start + 1)
+        if n_matches > 1:
+            # restore the sorted order and remove duplicates
+            selected_formats = set(selected_formats)
+            selected_formats = [format for format in self
+                                if format in selected_formats]
+        return selected_formats
 
     def sort(self, *names):
         """Sort the registered format.
@@ -525,11 +694,26 @@ class FormatManager(object):
                                  'contain dots or commas.')
         names = [name.strip().upper() for name in names]
         # Reset
-        self._formats_sorted = list(self._formats)
-        # Sort
-        for name in reversed(names):
-            self._formats_sorted.sort(
-                key=lambda f: - ((f.name == name) + (f.name.endswith(name))))
+        self._formats_sorted = tuple(self._formats)
+        self.clear_cache()
+        # Sort once on the scores of all the names, the first name being the
+        # most important; the sort being stable, ties keep the registration
+        # order.
+        if names:
+            names_tuple = tuple(names)
+            no_match = (0,) * len(names)
+
+            def sort_key(format):
+                # most formats match none of the names: check them all at
+                # once with a single call to endswith
+                if not format.name.endswith(names_tuple):
+                    return no_match
+                return tuple(-((format.name == name) +
+                               format.name.endswith(name))
+                             for name in names)
+
+            self._formats_sorted = tuple(sorted(self._formats_sorted,
+                                                key=sort_key))
 
     def add_format(self, format, overwrite=False):
         """Register a given format.
@@ -550,19 +734,27 @@ class FormatManager(object):
         """
         if not isinstance(format, Format):
             raise ValueError('add_format needs argument to be a Format object')
-        elif format in self._formats:
+        elif self._formats_by_name.get(format.name) is format:
             raise ValueError('Given Format instance is already registered')
-        elif format.name in self.get_format_names():
+        elif format.name in self._formats_by_name:
             if overwrite:
-                old_format = self[format.name]
+                old_format = self._formats_by_name[format.name]
                 self._formats.remove(old_format)
-                if old_format in self._formats_sorted:
-                    self._formats_sorted.remove(old_format)
+                self._formats_sorted = tuple(
+                    f for f in self._formats_sorted if f is not old_format)
+                self._extension_index = None
             else:
                 raise ValueError('A Format named %r is already registered, use'
                                  ' overwrite=True to replace.' % format.name)
         self._formats.append(format)
-        self._formats_sorted.append(format)
+        self._formats_by_name[format.name] = format
+        self._formats_sorted += (format,)
+        self._name_index = None
+        # the new format comes last in the sorted order: extend the extension
+        # index instead of building it again
+        if self._extension_index is not None:
+            for ext in format.extensions:
+                self._extension_index.setdefault(ext, []).append(format)
 
     def search_read_format(self, request):
         """Search a specific format.
@@ -581,25 +773,36 @@ class FormatManager(object):
             format was found.
 
         """
-        select_ext = request.filename.lower()
+        filename = request.filename_lower
+
+        # keep track of the formats already asked
+        tried_formats = set()
+
+        # Select the first format, among the ones that seem to be able to
+        # read it, that can. If none could read it, it could be that file has
+        # no or the wrong extension. We ask the other formats.
+        for formats in (self._select_formats(filename), self):
+            for format in formats:
+                if format in tried_formats:
+                    continue
+                if format.can_read(request):
+                    return format
+                tried_formats.add(format)
 
-        # Select formats that seem to be able to read it
-        selected_formats = []
-        for format in self:
-            if select_ext.endswith(format.extensions):
-                selected_formats.append(format)
+    def clear_cache(self):
+        """Clear the caches used to look up the formats.
 
-        # Select the first that can
-        for format in selected_formats:
-            if format.can_read(request):
-                return format
+        Parameters
+        ----------
+        None
 
-        # If no format could read it, it could be that file has no or
-        # the wrong extension. We ask all formats again.
-        for format in self:
-            if format not in selected_formats:
-                if format.can_read(request):
-                    return format
+        Returns
+        -------
+        None
+
+        """
+        self._extension_index = None
+        self._name_index = None
 
     def get_format_names(self):
         """Get the names of all registered formats."""
@@ -8,6 +8,7 @@ format, use the :func:`.help` function.
 Functions for reading:
 
   * :func:`.specread` - read a file with spectra from the specified uri
+  * :func:`.specread_many` - iterate over the spectra of several files
 
 More control:
 
@@ -39,6 +40,8 @@ from __future__ import print_function
 
 import os
 import glob
+import fnmatch
+from collections import OrderedDict, deque
 from itertools import chain
 
 import numpy as np
@@ -47,6 +50,9 @@ from . import Request
 from .util import Spectrum
 from .. import formats
 
+# the files smaller than this size are left to the readahead of the system
+_READAHEAD_MIN_SIZE = 1 << 20
+
 
 def help(name=None):
     """Print the help regarding a given format.
@@ -86,7 +92,8 @@ def get_reader(uri, format=None, **kwargs):
 
     kwargs : dict
         Further keyword arguments are passed to the reader. See :func:`.help`
-        to see what arguments are available for a particular format.
+        to see what arguments are available for a particular format. The
+        ``buffering`` keyword is used by :class:`.Request` to open the file.
 
     Returns
     -------
@@ -119,6 +126,190 @@ def _get_reader_get_data(uri, format, **kwargs):
         return reader.get_data(index=None)
 
 
+def _hint_readahead(filename):
+    """Ask the system to start loading a file in the page cache.
+
+    The call returns immediately; nothing is done on the systems without
+    ``posix_fadvise`` or for the files smaller than ``_READAHEAD_MIN_SIZE``,
+    for which the hint would cost more system calls than it saves.
+
+    Parameters
+    ----------
+    filename : str
+        The file which will be read next.
+
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        if os.stat(filename).st_size < _READAHEAD_MIN_SIZE:
+            return
+        fd = os.open(filename, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _effective_n_jobs(n_jobs):
+    """Resolve the number of threads to use.
+
+    Parameters
+    ----------
+    n_jobs : int
+        The number of threads requested. 0 is taken as 1 and a negative
+        value as the number of CPUs.
+
+    Returns
+    -------
+    n_jobs : int
+        The number of threads to use, at least 1.
+
+    """
+    if n_jobs < 0:
+        from multiprocessing import cpu_count
+        return cpu_count()
+    return max(n_jobs, 1)
+
+
+def _iter_filenames(filenames, format, n_jobs, **kwargs):
+    """Read each file and yield the data in the same order.
+
+    Parameters
+    ----------
+    filenames : list of str
+        The files to be read.
+
+    format : str
+        The format to use to read the files.
+
+    n_jobs : int
+        The number of threads used to read the files. If -1, the number of
+        threads is set to the number of CPUs.
+
+    kwargs : dict
+        Further keyword arguments passed to the reader.
+
+    Yields
+    ------
+    spectrum : Spectrum or list of Spectrum
+        The data read from each file.
+
+    """
+    n_jobs = min(_effective_n_jobs(n_jobs), len(filenames))
+    if n_jobs <= 1:
+        for i, f in enumerate(filenames):
+            if i + 1 < len(filenames):
+                # let the system load the next file while reading this one
+                _hint_readahead(filenames[i + 1])
+            yield _get_reader_get_data(f, format, **kwargs)
+        return
+
+    # importing multiprocessing is costly, only pay it when needed
+    from multiprocessing.pool import ThreadPool
+    pool = ThreadPool(n_jobs)
+    try:
+        # read at most two files ahead per thread to bound the memory
+        pending = deque()
+        for f in filenames:
+            pending.append(pool.apply_async(_get_reader_get_data,
+                                            (f, format), kwargs))
+            if len(pending) >= 2 * n_jobs:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        # stop the pending reads if the iteration is interrupted
+        pool.terminate()
+        pool.join()
+
+
+def _share_wavelength(data, wavelength_cache):
+    """Make the spectra with identical wavelength share a single array.
+
+    Parameters
+    ----------
+    data : Spectrum or list of Spectrum
+        The data read from a file.
+
+    wavelength_cache : dict
+        The wavelength arrays already seen, keyed by their content.
+
+    Returns
+    -------
+    data : Spectrum or list of Spectrum
+        The same data, modified in place.
+
+    """
+    for sp in (data if isinstance(data, list) else [data]):
+        # hashing large arrays is not worth it
+        if isinstance(sp, Spectrum) and sp.wavelength.nbytes <= 1 << 20:
+            wavelength = sp.wavelength
+            key = (wavelength.dtype.str, wavelength.shape,
+                   wavelength.tobytes())
+            sp.wavelength = wavelength_cache.setdefault(key, wavelength)
+    return data
+
+
+def _read_filenames(filenames, format, n_jobs, **kwargs):
+    """Read each file and return the list of data in the same order.
+
+    The spectra having identical wavelength share the same wavelength array.
+    See :func:`_iter_filenames` for the parameters.
+
+    """
+    wavelength_cache = {}
+    return [_share_wavelength(data, wavelength_cache)
+            for data in _iter_filenames(filenames, format, n_jobs, **kwargs)]
+
+
+def _glob_patterns(patterns):
+    """Expand several patterns, listing each directory only once.
+
+    Parameters
+    ----------
+    patterns : list of str
+        The patterns to expand. Only the last component of a pattern can
+        contain a wildcard to share the listing of its directory; the other
+        patterns are given to :func:`glob.glob`.
+
+    Returns
+    -------
+    filenames : list of list of str
+        The sorted filenames matched by each pattern.
+
+    """
+    listings = {}
+    filenames = []
+    for pattern in patterns:
+        pattern = os.path.expanduser(pattern)
+        if not glob.has_magic(pattern):
+            # a plain filename: nothing to list nor to sort
+            filenames.append([pattern] if os.path.lexists(pattern) else [])
+            continue
+        dirname, basename = os.path.split(pattern)
+        if (not glob.has_magic(basename) or glob.has_magic(dirname) or
+                '**' in basename):
+            filenames.append(sorted(glob.glob(pattern)))
+            continue
+        if dirname not in listings:
+            try:
+                listings[dirname] = os.listdir(dirname or os.curdir)
+            except OSError:
+                listings[dirname] = []
+        names = listings[dirname]
+        if not basename.startswith('.'):
+            # as glob, hidden files are only matched explicitly
+            names = [name for name in names if not name.startswith('.')]
+        filenames.append(sorted(os.path.join(dirname, name)
+                                for name in fnmatch.filter(names, basename)))
+    return filenames
+
+
 def _validate_filenames(uri):
     """Check the filenames and expand in the case of wildcard.
 
@@ -134,14 +325,31 @@ def _validate_filenames(uri):
     Returns
     -------
     filenames : list of str
-        Returns a list of all file names.
+        Returns a list of all absolute file names. A file matched several
+        times is only returned at its first occurrence.
 
     """
     if isinstance(uri, list):
-        return list(chain.from_iterable(
-            [sorted(glob.glob(os.path.expanduser(f))) for f in uri]))
+        filenames = chain.from_iterable(_glob_patterns(uri))
     else:
-        return sorted(glob.glob(os.path.expanduser(uri)))
+        filenames = sorted(glob.glob(os.path.expanduser(uri)))
+
+    # make the filenames absolute, getting the working directory once, and
+    # remove the files matched by several patterns
+    cwd = os.getcwd()
+    unique_filenames = OrderedDict()
+    for f in filenames:
+        f = os.path.normpath(os.path.join(cwd, f))
+        unique_filenames.setdefault(os.path.normcase(f), f)
+    return list(unique_filenames.values())
+
+
+def _share_memory(a, b):
+    """Check that two arrays are views of the exact same data."""
+    return a is b or (
+        a.__array_interface__['data'][0] == b.__array_interface__['data'][0]
+        and a.shape == b.shape and a.strides == b.strides and
+        a.dtype == b.dtype)
 
 
 def _zip_spectrum(spectrum, tol_wavelength):
@@ -162,31 +370,43 @@ def _zip_spectrum(spectrum, tol_wavelength):
         The zipped spectra(um) if it was possible to zip them.
 
     """
-    all_spectrum = all([isinstance(sp, Spectrum) for sp in spectrum])
+    all_spectrum = all(isinstance(sp, Spectrum) for sp in spectrum)
 
     if all_spectrum:
         # check that the wavelength of the different spectrum are the
         # same and concatenate all spectrum in a single data structure
         wavelength = spectrum[0].wavelength
         try:
-            consistent_wavelength = [np.allclose(sp.wavelength,
-                                                 wavelength,
-                                                 atol=tol_wavelength)
-                                     for sp in spectrum]
-            if not all(consistent_wavelength):
-                return spectrum
+            # readers often share a single wavelength array between their
+            # spectra: there is nothing to compare in this case
+            if not all(_share_memory(sp.wavelength, wavelength)
+                       for sp in spectrum):
+                # compare all the wavelength at once
+                all_wavelength = np.stack([sp.wavelength for sp in spectrum])
+                if not np.allclose(all_wavelength, wavelength,
+                                   atol=tol_wavelength):
+                    return spectrum
 
         except ValueError:
-            # the above comparison will fail when two arrays have
+            # the above stacking will fail when two arrays have
             # different sizes
             return spectrum
 
         else:
-            spectrum_2d, meta_2d = zip(*[(sp.amplitudes, sp.meta)
-                                         for sp in spectrum])
-            return Spectrum(np.vstack(spectrum_2d),
-                            wavelength,
-                            meta_2d)
+            # copy the amplitudes in a preallocated array instead of stacking
+            n_rows, dtypes = [], []
+            for sp in spectrum:
+                n_rows.append(1 if sp.amplitudes.ndim == 1
+                              else sp.amplitudes.shape[0])
+                dtypes.append(sp.amplitudes.dtype)
+            amplitudes = np.empty((sum(n_rows), wavelength.shape[0]),
+                                  dtype=np.result_type(*dtypes))
+            start = 0
+            for sp, n in zip(spectrum, n_rows):
+                amplitudes[start:start + n] = sp.amplitudes
+                start += n
+            meta_2d = tuple(sp.meta for sp in spectrum)
+            return Spectrum(amplitudes, wavelength, meta_2d)
 
     else:
         # chain the spectrum into a single list
@@ -199,7 +419,7 @@ def _zip_spectrum(spectrum, tol_wavelength):
         return output_spectrum
 
 
-def specread(uri, format=None, tol_wavelength=1e-5, **kwargs):
+def specread(uri, format=None, tol_wavelength=1e-5, n_jobs=1, **kwargs):
     """Read spectra in a given format.
 
     Reads spectrum from the specified file. Returns a list or a
@@ -224,9 +444,14 @@ def specread(uri, format=None, tol_wavelength=1e-5, **kwargs):
         Tolerance to merge spectrum when their wavelength are slightly
         different.
 
+    n_jobs : int, optional (default=1)
+        The number of threads used to read the files when several files are
+        given. If -1, the number of threads is set to the number of CPUs.
+
     kwargs : dict
         Further keyword arguments are passed to the reader. See :func:`.help`
-        to see what arguments are available for a particular format.
+        to see what arguments are available for a particular format. The
+        ``buffering`` keyword is used by :class:`.Request` to open the file.
 
     Returns
     -------
@@ -242,7 +467,45 @@ def specread(uri, format=None, tol_wavelength=1e-5, **kwargs):
 
     """
     filenames = _validate_filenames(uri)
-    spectrum = [_get_reader_get_data(f, format, **kwargs)
-                for f in filenames]
+    spectrum = _read_filenames(filenames, format, n_jobs, **kwargs)
     return (_zip_spectrum(spectrum, tol_wavelength) if len(spectrum) > 1
             else spectrum[0])
+
+
+def specread_many(uri, format=None, n_jobs=1, **kwargs):
+    """Iterate over the spectra of several files.
+
+    Lazily read the files matching ``uri`` one after the other and yield the
+    data of each file, without gathering all the spectra in memory as
+    :func:`specread` does.
+
+    Parameters
+    ----------
+    uri : {str, list of str}
+        The resource to load the spectrum from. The input accepted are:
+
+        * a filename or a list of filename of spectrum;
+        * a filename or a list of filename containing a wildcard
+          (e.g. ``'./data/*.spc'``).
+
+    format : str
+        The format to use to read the files. By default specio selects
+        the appropriate for you based on the filenames and their contents.
+
+    n_jobs : int, optional (default=1)
+        The number of threads used to read the files ahead. If -1, the number
+        of threads is set to the number of CPUs.
+
+    kwargs : dict
+        Further keyword arguments are passed to the reader. See :func:`.help`
+        to see what arguments are available for a particular format. The
+        ``buffering`` keyword is used by :class:`.Request` to open the file.
+
+    Yields
+    ------
+    spectrum : specio.core.Spectrum or a list of specio.core.Spectrum
+        The data of each file, in the order of the filenames.
+
+    """
+    filenames = _validate_filenames(uri)
+    return _iter_filenames(filenames, format, n_jobs, **kwargs)
@@ -5,12 +5,23 @@
 # License: BSD 3 clause
 
 import os
-import sys
-from six import string_types, binary_type
+import threading
+from collections import OrderedDict
+from six import string_types
 
 URI_FILE = 2
 URI_FILENAME = 3
 
+# Number of bytes read at once at the start of a file
+HEADER_SIZE = 16 * 1024
+
+# Headers of the files recently probed, keyed by filename, size and
+# modification time. Reading a file again does not need to open it to find
+# its format.
+_HEADER_CACHE = OrderedDict()
+_HEADER_CACHE_SIZE = 64
+_HEADER_LOCK = threading.Lock()
+
 
 class Request(object):
     """Interface between a plugin and the spectra resource.
@@ -31,6 +42,10 @@ class Request(object):
     uri : {str, file}
         The resource to load the image from.
 
+    buffering : int, optional (default=-1)
+        The buffering policy used when opening a filename, as in the builtin
+        :func:`open`. By default, the system default buffer size is used.
+
     kwargs : dict
         Keywords to pass to the plugin.
 
@@ -39,13 +54,19 @@ class Request(object):
     filename : str
         The filename of the file to be read.
 
+    filename_lower : str
+        The lower case filename, used by the formats to match extensions.
+
     """
 
-    def __init__(self, uri, **kwargs):
+    def __init__(self, uri, buffering=-1, **kwargs):
 
         # General
         self._uri_type = None
         self._filename = None
+        self._filename_lower = None
+        self._buffering = buffering
+        self._stat = None
         self._kwargs = kwargs
 
         # To handle the user-side
@@ -54,6 +75,8 @@ class Request(object):
         # To handle the plugin side
         self._file = None               # To store the file instance
         self._firstbytes = None         # For easy header parsing
+        self._header = None             # The start of the file, read once
+        self._header_size = 0
 
         # To store formats that may be able to fulfil this request
         # self._potential_formats = []
@@ -63,33 +86,12 @@ class Request(object):
 
     def _parse_uri(self, uri):
         """ Try to figure our what we were given."""
-        py3k = sys.version_info[0] == 3
-
         if isinstance(uri, string_types):
-            # Explicit
-            if uri.startswith('file://'):
-                self._uri_type = URI_FILENAME
-                self._filename = uri[7:]
-            # Less explicit (particularly on py 2.x)
-            elif py3k:
-                self._uri_type = URI_FILENAME
-                self._filename = uri
-            else:  # pragma: no cover - our ref for coverage is py3k
-                try:
-                    isfile = os.path.isfile(uri)
-                except Exception:
-                    isfile = False  # If checking does not even work ...
-                if isfile:
-                    self._uri_type = URI_FILENAME
-                    self._filename = uri
-                elif len(uri) < 256:  # Can go wrong with veeery tiny images
-                    self._uri_type = URI_FILENAME
-                    self._filename = uri
-                else:
-                    self._uri_type = URI_FILENAME
-                    self._filename = uri
+            self._uri_type = URI_FILENAME
+            # Explicit or less explicit filename
+            self._filename = uri[7:] if uri.startswith('file://') else uri
         # Files
-        if hasattr(uri, 'read') and hasattr(uri, 'close'):
+        elif hasattr(uri, 'read') and hasattr(uri, 'close'):
             self._uri_type = URI_FILE
             self._filename = '<file>'
             self._file = uri
@@ -112,8 +114,11 @@ class Request(object):
         # Check whether file name is valid
         if self._uri_type == URI_FILENAME:
             fn = self._filename
-            # Reading: check that the file exists (but is allowed a dir)
-            if not os.path.exists(fn):
+            # Reading: check that the file exists (but is allowed a dir). The
+            # status is kept to identify the cached header of the file.
+            try:
+                self._stat = os.stat(fn)
+            except OSError:
                 raise IOError("No such file: '%s'" % fn)
 
     @property
@@ -121,6 +126,13 @@ class Request(object):
         """Filename of the resource."""
         return self._filename
 
+    @property
+    def filename_lower(self):
+        """Lower case filename of the resource, to match extensions."""
+        if self._filename_lower is None:
+            self._filename_lower = self._filename.lower()
+        return self._filename_lower
+
     @property
     def kwargs(self):
         """Keywords required to read the file."""
@@ -155,7 +167,7 @@ class Request(object):
             return self._file
 
         if self._uri_type == URI_FILENAME:
-            self._file = open(self.filename, 'rb')
+            self._file = open(self.filename, 'rb', self._buffering)
 
         return self._file
 
@@ -198,29 +210,92 @@ class Request(object):
         """The first 256 bytes of the file. These can be used to parse the
         header to determine the file-format."""
         if self._firstbytes is None:
-            self._read_first_bytes()
+            self._firstbytes = self.get_header(256)
         return self._firstbytes
 
-    def _read_first_bytes(self, N=256):
+    def get_header(self, N=HEADER_SIZE):
+        """Get the first bytes of the file.
+
+        The first 16 KiB of the file are read at once and kept in memory, so
+        that formats needing more than :attr:`firstbytes` to parse a header do
+        not read the file again.
+
+        Parameters
+        ----------
+        N : int, optional (default=16384)
+            The number of bytes to get. Less bytes are returned if the file is
+            smaller.
+
+        Returns
+        -------
+        header : bytes
+            The N first bytes of the file.
+
+        """
+        if self._header is None or (N > self._header_size and
+                                    len(self._header) == self._header_size):
+            self._read_header(max(N, HEADER_SIZE))
+        return self._header[:N]
+
+    def _read_header(self, N):
+        self._header_size = N
+        key = None
+        if self._uri_type == URI_FILENAME:
+            stat = self._stat
+            key = (self._filename, N, stat.st_size,
+                   getattr(stat, 'st_mtime_ns', stat.st_mtime))
+            with _HEADER_LOCK:
+                header = _HEADER_CACHE.pop(key, None)
+                if header is not None:
+                    # move it to the end, as the most recently used
+                    _HEADER_CACHE[key] = header
+                    self._header = header
+                    return
+
+        self._read_header_from_file(N)
+
+        if key is not None:
+            with _HEADER_LOCK:
+                _HEADER_CACHE[key] = self._header
+                if len(_HEADER_CACHE) > _HEADER_CACHE_SIZE:
+                    _HEADER_CACHE.popitem(last=False)
+
+    def _read_header_from_file(self, N):
         # Prepare
+        opened = self._file is None
         f = self.get_file()
-        try:
-            i = f.tell()
-        except Exception:
-            i = None
+        if self._uri_type == URI_FILENAME and hasattr(os, 'pread'):
+            # read at the start of the file without moving its offset
+            try:
+                self._header = os.pread(f.fileno(), N, 0)
+                return
+            except OSError:
+                # not seekable (e.g. a FIFO): read it as a stream below
+                pass
+        if opened:
+            # a file we just opened is at its start
+            i = 0
+        else:
+            try:
+                i = f.tell()
+            except Exception:
+                i = None
         # Read
-        self._firstbytes = read_n_bytes(f, N)
+        self._header = read_n_bytes(f, N)
         # Set back
         try:
             if i is None:
                 raise Exception('cannot seek with None')
             f.seek(i)
         except Exception:
-            # Prevent get_file() from reusing the file
-            self._file = None
             # If the given URI was a file object, we have a problem,
             if self._uri_type == URI_FILE:
+                self._file = None
                 raise IOError('Cannot seek back after getting firstbytes!')
+            # Prevent get_file() from reusing the file, which is opened
+            # again on demand
+            self._file = None
+            f.close()
 
 
 def read_n_bytes(f, N):
@@ -239,14 +314,22 @@ def read_n_bytes(f, N):
 
     Returns
     -------
-    bb : binary_type
+    bb : bytes
         The N first bytes.
 
     """
-    bb = binary_type()
-    while len(bb) < N:
-        extra_bytes = f.read(N-len(bb))
+    # a regular file gives all the bytes at once; only loop on short reads
+    bb = f.read(N)
+    if not bb:
+        return b''
+    if len(bb) == N:
+        return bb
+    chunks = [bb]
+    n_read = len(bb)
+    while n_read < N:
+        extra_bytes = f.read(N - n_read)
         if not extra_bytes:
             break
-        bb += extra_bytes
-    return bb
+        chunks.append(extra_bytes)
+        n_read += len(extra_bytes)
+    return b''.join(chunks)
@@ -12,12 +12,14 @@ from tempfile import mkdtemp
 from os.path import dirname, join
 
 import numpy as np
+from numpy.testing import assert_allclose
 
 from pytest import raises
 
 from specio import formats
 from specio.core import Format, Request, FormatManager
 from specio.core import Spectrum
+from specio.datasets import load_csv_path
 from specio.plugins.example import DummyFormat
 
 DATA_PATH = module_path = dirname(__file__)
@@ -28,7 +30,7 @@ class MyFormat(Format):
     _closed = []
 
     def _can_read(self, request):
-        return request.filename.lower().endswith(self.extensions + ('.haha', ))
+        return request.filename_lower.endswith(self.extensions + ('.haha', ))
 
     class Reader(Format.Reader):
         _failmode = False
@@ -47,8 +49,8 @@ class MyFormat(Format):
                 raise IndexError()
             else:
                 self._read_frames += 1
-                return Spectrum(np.ones((10, 10)) * index,
-                                np.ones((10,)) * index,
+                return Spectrum(np.full((10, 10), index, dtype=float),
+                                np.full((10,), index, dtype=float),
                                 self._get_meta_data(index))
 
         def _get_meta_data(self, index):
@@ -72,6 +74,8 @@ def test_format():
     F4 = Format('test', '', '.foo .bar .spam')
     for F in (F1, F2, F3, F4):
         assert set(F.extensions) == set(['.foo', '.bar', '.spam'])
+    F5 = Format('test', '', 'foo .FOO bar foo')
+    assert F5.extensions == ('.foo', '.bar')
     # Fail
     with pytest.raises(ValueError,
                        message="Invalid value for extensions given."):
@@ -140,6 +144,97 @@ def test_reader():
         [spec for spec in R]
 
 
+@pytest.mark.parametrize(
+    "amplitudes,meta,index,expected_meta",
+    [(np.ones((10,)), {'filename': 'a'}, None, {'filename': 'a'}),
+     (np.ones((10,)), {'filename': 'a'}, 0, {'filename': 'a'}),
+     (np.ones((2, 10)), ({'filename': 'a'}, {'filename': 'b'}), 1,
+      {'filename': 'b'})])
+def test_reader_get_meta_data(amplitudes, meta, index, expected_meta):
+    tmp_dir = mkdtemp()
+    filename = join(tmp_dir, 'spectra.csv')
+    try:
+        Spectrum(amplitudes, np.arange(10), meta).to_csv(filename)
+        with formats['CSV'].get_reader(Request(filename)) as R:
+            assert R.get_meta_data(index) == expected_meta
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_reader_iter_data_2d():
+    tmp_dir = mkdtemp()
+    filename = join(tmp_dir, 'spectra.csv')
+    amplitudes = np.random.random((3, 10))
+    meta = tuple({'filename': 'sp%d' % i} for i in range(3))
+    try:
+        Spectrum(amplitudes, np.arange(10), meta).to_csv(filename)
+        with formats['CSV'].get_reader(Request(filename)) as R:
+            specs = list(R)
+            assert len(specs) == 3
+            for i, spec in enumerate(specs):
+                assert_allclose(spec.amplitudes, R.get_data(i).amplitudes)
+                assert_allclose(spec.wavelength, np.arange(10))
+                assert spec.meta == meta
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_reader_streaming():
+    filename = join(DATA_PATH, 'data', 'spectra.foobar')
+
+    class StreamingFormat(MyFormat):
+        class Reader(MyFormat.Reader):
+            _streaming = True
+
+            def _get_length(self):
+                raise RuntimeError('The length should not be requested.')
+
+            def _get_data(self, index):
+                if index >= 5:
+                    raise IndexError()
+                return MyFormat.Reader._get_data(self, index)
+
+    R = StreamingFormat('test', '').get_reader(Request(filename))
+    specs = [spec for spec in R]
+    assert len(specs) == 5
+    assert [spec.meta['index'] for spec in specs] == list(range(5))
+
+
+def test_reader_get_all_data():
+    filename = join(DATA_PATH, 'data', 'spectra.foobar')
+
+    class ListFormat(MyFormat):
+        class Reader(Format.Reader):
+            def _open(self, wavelength=None):
+                self._data = [
+                    Spectrum(np.full((10,), i, dtype=float),
+                             np.arange(10) if wavelength is None
+                             else wavelength[i],
+                             {'index': i})
+                    for i in range(3)]
+
+            def _close(self):
+                pass
+
+    R = ListFormat('test', '').get_reader(Request(filename))
+    spec = R.get_all_data()
+    assert spec.amplitudes.shape == (3, 10)
+    assert_allclose(spec.amplitudes[:, 0], [0, 1, 2])
+    assert_allclose(spec.wavelength, np.arange(10))
+    assert spec.meta == ({'index': 0}, {'index': 1}, {'index': 2})
+
+    wavelength = [np.arange(10), np.arange(10), np.arange(1, 11)]
+    R = ListFormat('test', '').get_reader(Request(filename,
+                                                  wavelength=wavelength))
+    with pytest.raises(ValueError, match="do not share the same wavelength"):
+        R.get_all_data()
+
+    # a 2D Spectrum is given back untouched
+    R = formats['CSV'].get_reader(Request(load_csv_path()))
+    spec = R.get_all_data()
+    assert spec is R._data
+
+
 def test_default_can_read():
     F = DummyFormat('test', '', 'foobar')
 
@@ -188,7 +283,9 @@ def test_format_manager():
 
     F1 = formats['FOOBAR']
     F2 = formats['.foobar']
+    F3 = formats[join(DATA_PATH, 'data', 'spectra.foobar')]
     assert F1 is F2
+    assert F1 is F3
     with pytest.raises(ValueError,
                        message="Looking up a format should be done by"):
         formats.__getitem__(678)
@@ -223,6 +320,98 @@ def test_format_manager():
     formats.show()
 
 
+def test_format_manager_select_formats():
+    manager = FormatManager()
+    format_gz = Format('gz', '', 'gz')
+    format_tar = Format('tar', '', 'tar.gz tgz')
+    manager.add_format(format_gz)
+    manager.add_format(format_tar)
+
+    assert manager._select_formats('/data.d/file.gz') == [format_gz]
+    assert manager._select_formats('/data.tar/file.gz') == [format_gz]
+    assert manager._select_formats('file.tgz') == [format_tar]
+    assert manager._select_formats('file.tar.gz') == [format_gz, format_tar]
+    assert manager._select_formats('file.zip') == []
+    assert manager['.gz'] is format_gz
+
+    manager.sort('tar')
+    assert manager._select_formats('file.tar.gz') == [format_tar, format_gz]
+
+    # registering formats keeps the extension index up to date
+    format_zip = Format('zip', '', 'zip gz')
+    manager.add_format(format_zip)
+    assert manager._select_formats('file.zip') == [format_zip]
+    assert manager._select_formats('file.gz') == [format_gz, format_zip]
+    format_gz2 = Format('gz', '', 'gzip')
+    manager.add_format(format_gz2, overwrite=True)
+    assert manager._select_formats('file.gz') == [format_zip]
+    assert manager._select_formats('file.gzip') == [format_gz2]
+
+
+def test_format_manager_name_lookup():
+    manager = FormatManager()
+    format_spc_old = Format('spc-old', '', 'old')
+    format_spc_new = Format('spc-new', '', 'new')
+    manager.add_format(format_spc_old)
+    manager.add_format(format_spc_new)
+    assert manager['spc-new'] is format_spc_new
+    assert manager['spc'] is format_spc_old
+    assert manager['new'] is format_spc_new
+
+    # a full name takes precedence over the prefix of another name
+    format_spc = Format('spc', '', 'spc')
+    manager.add_format(format_spc)
+    assert manager['spc'] is format_spc
+    with pytest.raises(IndexError):
+        manager['foo']
+
+
+class SuffixFormat(Format):
+    """Format reading the files ending with a given suffix."""
+
+    def __init__(self, name, description, extensions=None, suffix=''):
+        super(SuffixFormat, self).__init__(name, description, extensions)
+        self.suffix = suffix
+
+    def _can_read(self, request):
+        return request.filename_lower.endswith(self.suffix)
+
+
+def test_format_manager_search_order(tmpdir):
+    filenames = []
+    for name in ('first.foobar', 'second.foobar'):
+        tmpdir.join(name).write('')
+        filenames.append(str(tmpdir.join(name)))
+    manager = FormatManager()
+    # a selective format preferred over a generic one
+    format_1 = SuffixFormat('format1', '', 'foobar', suffix='second.foobar')
+    format_2 = SuffixFormat('format2', '', 'foobar')
+    manager.add_format(format_1)
+    manager.add_format(format_2)
+
+    # the format chosen does not depend on the files read before
+    assert manager.search_read_format(Request(filenames[0])) is format_2
+    assert manager.search_read_format(Request(filenames[1])) is format_1
+    manager = FormatManager()
+    manager.add_format(format_1)
+    manager.add_format(format_2)
+    assert manager.search_read_format(Request(filenames[1])) is format_1
+
+
+def test_format_manager_sort():
+    manager = FormatManager()
+    for name in ('spam', 'foo-bar', 'bar', 'foo'):
+        manager.add_format(Format(name, ''))
+    assert manager.get_format_names() == ['SPAM', 'FOO-BAR', 'BAR', 'FOO']
+    manager.sort('bar')
+    assert manager.get_format_names() == ['BAR', 'FOO-BAR', 'SPAM', 'FOO']
+    manager.sort('foo', 'bar')
+    assert manager.get_format_names() == ['FOO', 'BAR', 'FOO-BAR', 'SPAM']
+    manager.sort()
+    assert manager.get_format_names() == ['SPAM', 'FOO-BAR', 'BAR', 'FOO']
+    assert manager['foo'].name == 'FOO'
+
+
 @pytest.mark.parametrize(
     "type_error,msg,params",
     [(TypeError, "accepts only string name", 3),
@@ -231,3 +420,19 @@ def test_format_manager():
 def test_sorting_errors(type_error, msg, params):
     with pytest.raises(type_error, message=msg):
         formats.sort(params)
+
+
+def test_format_slots():
+    # the base classes do not carry an instance dict but the plugins
+    # subclassing them can still set their own attributes
+    format = Format('test', 'test description', 'testext1')
+    assert not hasattr(format, '__dict__')
+    with pytest.raises(AttributeError):
+        format.foo = 1
+
+    format = MyFormat('test', 'test description', 'testext1')
+    format.foo = 1
+    filename = join(DATA_PATH, 'data', 'spectra.foobar')
+    reader = format.get_reader(Request(filename))
+    reader.foo = 1
+    assert reader.foo == 1
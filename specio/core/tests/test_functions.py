@@ -4,6 +4,8 @@
 # Authors: Guillaume Lemaitre <guillaume.lemaitre@inria.fr>
 # License: BSD 3 clause
 
+import os
+from glob import glob
 from os.path import join, dirname
 
 import pytest
@@ -11,11 +13,15 @@ import pytest
 import numpy as np
 from numpy.testing import assert_allclose
 
-from specio import help, get_reader, specread
+from specio import help, get_reader, specread, specread_many
 from specio.core import Spectrum
+from specio.core.functions import _effective_n_jobs, _read_filenames
+from specio.core.functions import _hint_readahead, _READAHEAD_MIN_SIZE
+from specio.core.functions import _validate_filenames, _zip_spectrum
 
 DATA_PATH = dirname(__file__)
 RNG = np.random.RandomState(0)
+FILENAMES = ['filename'] * 10
 
 
 def test_help():
@@ -53,6 +59,73 @@ def test_specread_single_file():
     assert_allclose(spec1.wavelength, spec2.wavelength)
 
 
+@pytest.mark.parametrize("n_jobs", [2, -1])
+def test_specread_n_jobs(n_jobs):
+    filenames = join(DATA_PATH, 'data', '*.spc')
+    spec_serial = specread(filenames, 'foobar')
+    spec_parallel = specread(filenames, 'foobar', n_jobs=n_jobs)
+    assert len(spec_parallel) == 3
+    for sp_serial, sp_parallel in zip(spec_serial, spec_parallel):
+        assert_allclose(sp_parallel.amplitudes, sp_serial.amplitudes)
+        assert_allclose(sp_parallel.wavelength, sp_serial.wavelength)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_specread_many(n_jobs):
+    filenames = join(DATA_PATH, 'data', '*.spc')
+    spec = specread(filenames, 'foobar')
+    spec_iter = specread_many(filenames, 'foobar', n_jobs=n_jobs)
+    assert not isinstance(spec_iter, list)
+    spec_iter = list(spec_iter)
+    assert len(spec_iter) == 3
+    for sp, sp_iter in zip(spec, spec_iter):
+        assert_allclose(sp_iter.amplitudes, sp.amplitudes)
+        assert_allclose(sp_iter.wavelength, sp.wavelength)
+
+
+def test_effective_n_jobs():
+    from multiprocessing import cpu_count
+    assert _effective_n_jobs(0) == 1
+    assert _effective_n_jobs(3) == 3
+    assert _effective_n_jobs(-1) == _effective_n_jobs(-2) == cpu_count()
+
+
+@pytest.mark.skipif(not hasattr(os, 'posix_fadvise'),
+                    reason='requires posix_fadvise')
+def test_hint_readahead(tmpdir, mocker):
+    small_filename = str(tmpdir.join('small.spc'))
+    large_filename = str(tmpdir.join('large.spc'))
+    with open(small_filename, 'wb') as f:
+        f.write(b'\x00' * 10)
+    with open(large_filename, 'wb') as f:
+        f.truncate(_READAHEAD_MIN_SIZE)
+    fadvise = mocker.patch('os.posix_fadvise')
+    # the small files are not worth the system calls
+    _hint_readahead(small_filename)
+    assert not fadvise.called
+    _hint_readahead(large_filename)
+    assert fadvise.call_count == 1
+
+
+def test_validate_filenames_duplicate():
+    filename = join(DATA_PATH, 'data', 'spectra.foobar')
+    filenames = _validate_filenames([join(DATA_PATH, 'data', '*.foobar'),
+                                     filename,
+                                     join(DATA_PATH, '..', 'tests', 'data',
+                                          'spectra.foobar')])
+    assert filenames == [filename]
+
+
+def test_validate_filenames_patterns():
+    data_path = join(DATA_PATH, 'data')
+    filenames = _validate_filenames([join(data_path, '*.spc'),
+                                     join(data_path, 'spectra.*'),
+                                     join(data_path, '*_c[12].spc'),
+                                     join(data_path, 'notexisting', '*.spc')])
+    assert filenames == (sorted(glob(join(data_path, '*.spc'))) +
+                         sorted(glob(join(data_path, 'spectra.*'))))
+
+
 def _generate_spectrum_identical_wavelength(*args):
     """Generate spectrum with identical wavelength."""
     n_wavelength = 5
@@ -108,7 +181,7 @@ def test_specread_consitent_wavelength(side_effect, tol_wavelength,
                                        spectra_type, spectra_shape, mocker):
     # emulate that we read several file
     mocker.patch('specio.core.functions._validate_filenames',
-                 return_value=['filename' for _ in range(10)])
+                 return_value=FILENAMES)
 
     mocker.patch('specio.core.functions._get_reader_get_data',
                  side_effect=side_effect)
@@ -122,3 +195,30 @@ def test_specread_consitent_wavelength(side_effect, tol_wavelength,
         assert spectra.meta == tuple({} for _ in range(spectra_shape[0]))
     elif isinstance(spectra, list):
         assert len(spectra) == spectra_shape
+
+
+def test_zip_spectrum_shared_wavelength(mocker):
+    wavelength = np.arange(5)
+    spectrum = [Spectrum(np.ones(5) * i, wavelength) for i in range(3)]
+    spectrum.append(Spectrum(np.ones(5) * 3, wavelength[:]))
+    spy = mocker.spy(np, 'allclose')
+    spectra = _zip_spectrum(spectrum, 1e-5)
+    assert spy.call_count == 0
+    assert spectra.amplitudes.shape == (4, 5)
+    assert_allclose(spectra.amplitudes[:, 0], [0, 1, 2, 3])
+
+    # a copy of the wavelength is compared
+    spectrum.append(Spectrum(np.ones(5) * 4, wavelength.copy()))
+    spectra = _zip_spectrum(spectrum, 1e-5)
+    assert spy.call_count == 1
+    assert spectra.amplitudes.shape == (5, 5)
+
+
+def test_read_filenames_share_wavelength(mocker):
+    mocker.patch('specio.core.functions._get_reader_get_data',
+                 side_effect=[Spectrum(np.ones(5), np.arange(5.)),
+                              [Spectrum(np.ones(5), np.arange(5.)),
+                               Spectrum(np.ones(4), np.arange(4.))]])
+    data = _read_filenames(['filename1', 'filename2'], None, 1)
+    assert data[1][0].wavelength is data[0].wavelength
+    assert data[1][1].wavelength is not data[0].wavelength
@@ -4,8 +4,9 @@
 # Authors: Guillaume Lemaitre <guillaume.lemaitre@inria.fr>
 # License: BSD 3 clause
 
-import shutil
 import os
+import shutil
+import threading
 from os.path import dirname, join, sep, expanduser
 
 import pytest
@@ -13,8 +14,17 @@ from pytest import raises
 
 from specio import core
 from specio.core import Request
+from specio.core.request import HEADER_SIZE, read_n_bytes
 
 DATA_PATH = module_path = dirname(__file__)
+FOOBAR_PATH = join(DATA_PATH, 'data', 'spectra.foobar')
+
+
+@pytest.fixture(scope='module')
+def foobar_bytes():
+    # the content of the test file, read once for the module
+    with open(FOOBAR_PATH, 'rb') as f:
+        return f.read()
 
 
 class File():
@@ -31,7 +41,7 @@ class File():
         pass
 
 
-def test_request():
+def test_request(tmpdir, monkeypatch):
     filename = 'file://' + join(DATA_PATH, 'data', 'spectra.foobar')
     R = Request(filename)
     assert R._uri_type == core.request.URI_FILENAME
@@ -52,14 +62,27 @@ def test_request():
     assert R.get_local_filename() == filename
     assert R.get_file().name == filename
 
-    shutil.copy(filename, expanduser('~/'))
+    # use a temporary home directory
+    monkeypatch.setenv('HOME', str(tmpdir))
+    monkeypatch.setenv('USERPROFILE', str(tmpdir))
+    shutil.copy(filename, str(tmpdir))
     filename = '~/spectra.foobar'
     R = Request(filename)
     assert R.filename == expanduser('~/spectra.foobar').replace('/', sep)
-    os.remove(expanduser(filename))
+    assert R.filename == str(tmpdir.join('spectra.foobar'))
     filename = join(DATA_PATH, 'data', 'spectra.foobar')
     R = Request(filename, some_kwarg='something')
     assert R.kwargs == {'some_kwarg': 'something'}
+    # the plugins can store information on the request
+    R.some_attribute = 'something'
+    assert R.some_attribute == 'something'
+
+
+def test_request_buffering(foobar_bytes):
+    R = Request(FOOBAR_PATH, buffering=1 << 20, some_kwarg='something')
+    assert R.kwargs == {'some_kwarg': 'something'}
+    assert R.firstbytes == foobar_bytes[:256]
+    R._finish()
 
 
 @pytest.mark.parametrize(
@@ -73,13 +96,76 @@ def test_request_error(type_error, msg, params):
         Request(params)
 
 
-def test_request_read_sources():
-    filename = join(DATA_PATH, 'data', 'spectra.foobar')
-    R = Request(filename)
+def test_request_read_sources(foobar_bytes):
+    R = Request(FOOBAR_PATH)
     first_bytes = R.firstbytes
-    all_bytes = open(filename, 'rb').read()
     assert len(first_bytes) == 256
-    assert all_bytes.startswith(first_bytes)
+    assert foobar_bytes.startswith(first_bytes)
+
+
+def test_request_get_header(tmpdir):
+    filename = str(tmpdir.join('spectra.bin'))
+    content = bytes(bytearray(range(256))) * 100
+    with open(filename, 'wb') as f:
+        f.write(content)
+
+    R = Request(filename)
+    assert R.firstbytes == content[:256]
+    assert R.get_header(1000) == content[:1000]
+    assert R.get_header() == content[:HEADER_SIZE]
+    # larger headers are read again from the file
+    assert R.get_header(20000) == content[:20000]
+    assert R.get_header(30000) == content
+    R._finish()
+
+
+def test_request_firstbytes_cache(tmpdir):
+    filename = str(tmpdir.join('spectra.foobar'))
+    shutil.copy(FOOBAR_PATH, filename)
+    first_bytes = Request(filename).firstbytes
+
+    # the header of a file already probed is read without opening it
+    R = Request(filename)
+    assert R.firstbytes == first_bytes
+    assert R._file is None
+
+    # a modified file is read again
+    with open(filename, 'wb') as f:
+        f.write(b'\x01' * 10)
+    R = Request(filename)
+    assert R.firstbytes == b'\x01' * 10
+
+
+@pytest.mark.skipif(not hasattr(os, 'mkfifo'), reason='requires FIFOs')
+def test_request_firstbytes_fifo(tmpdir):
+    filename = str(tmpdir.join('spectra.fifo'))
+    os.mkfifo(filename)
+    content = b'\x01' * 300
+
+    def _write():
+        with open(filename, 'wb') as f:
+            f.write(content)
+
+    writer = threading.Thread(target=_write)
+    writer.start()
+    try:
+        R = Request(filename)
+        assert R.firstbytes == content[:256]
+        R._finish()
+    finally:
+        writer.join()
+
+
+class SlowFile(File):
+    """File object returning at most 10 bytes per read."""
+
+    def read(self, n):
+        return b'\x00' * min(n, 10)
+
+
+@pytest.mark.parametrize("file_obj", [File(), SlowFile()])
+def test_read_n_bytes(file_obj):
+    assert read_n_bytes(file_obj, 256) == b'\x00' * 256
 
 
 def test_request_file_no_seek():
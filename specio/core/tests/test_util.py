@@ -5,8 +5,6 @@
 # License: BSD 3 clause
 
 import os
-from tempfile import mkdtemp
-from shutil import rmtree
 
 import pytest
 
@@ -24,12 +22,20 @@ from specio.core.util import Spectrum, Dict
 module_path = os.path.dirname(__file__)
 
 
+@pytest.fixture(
+    scope='module',
+    params=[os.path.join(module_path, 'data', '*.spc'), load_spc_path()])
+def spectrum(request):
+    # parse the spc files once per module and share the result between tests
+    return specread(request.param)
+
+
 @pytest.mark.parametrize(
     "spectrum,wavelength,msg",
-    [(np.ones((100, 100, 100)), np.ones((10,)), "1-D or 2-D"),
-     (np.ones((100, 100)), np.ones((100, 100)), "1-D or 2-D"),
-     (np.ones((100, 1000)), np.ones((100,)), "The number of frequencies"),
-     (np.ones((10,)), np.ones((100,)), "The number of frequencies")])
+    [(np.empty((100, 100, 100)), np.empty((10,)), "1-D or 2-D"),
+     (np.empty((100, 100)), np.empty((100, 100)), "1-D or 2-D"),
+     (np.empty((100, 1000)), np.empty((100,)), "The number of frequencies"),
+     (np.empty((10,)), np.empty((100,)), "The number of frequencies")])
 def test_spectrum_error(spectrum, wavelength, msg):
     with pytest.raises(ValueError, message=msg):
         Spectrum(spectrum, wavelength)
@@ -46,12 +52,19 @@ def test_spectrum(spectrum, wavelength, metadata):
     assert spec.meta == {'kind': 'random'}
 
 
-@pytest.mark.parametrize(
-    "filename",
-    [(os.path.join(module_path, 'data', '*.spc')),
-     (load_spc_path())])
-def test_spectrum_to_dataframe(filename):
-    spec = specread(filename)
+@pytest.mark.parametrize("wavelength_dtype", [np.float32, np.int32])
+def test_spectrum_wavelength_dtype(wavelength_dtype):
+    wavelength = np.arange(10, dtype=np.float64)
+    spec = Spectrum(np.ones((10,)), wavelength,
+                    wavelength_dtype=wavelength_dtype)
+    assert spec.wavelength.dtype == wavelength_dtype
+    assert_allclose(spec.wavelength, wavelength)
+    spec = Spectrum(np.ones((10,)), wavelength)
+    assert spec.wavelength.dtype == np.float64
+
+
+def test_spectrum_to_dataframe(spectrum):
+    spec = spectrum
     df_spec = spec.to_dataframe()
     if isinstance(spec.meta, tuple):
         expected_index = np.array([meta['filename'] for meta in spec.meta])
@@ -62,24 +75,52 @@ def test_spectrum_to_dataframe(filename):
     assert_allclose(df_spec.values, np.atleast_2d(spec.amplitudes))
 
 
-@pytest.mark.parametrize(
-    "filename",
-    [(os.path.join(module_path, 'data', '*.spc')),
-     (load_spc_path())])
-def test_spectrum_to_csv(filename):
-    spec = specread(filename)
-    tmp_dir = mkdtemp()
-    filename = os.path.join(tmp_dir, 'spectra.csv')
-
-    try:
-        spec.to_csv(filename)
-        df = pd.read_csv(filename, index_col=0)
-        df.columns = df.columns.astype(float)
-        assert_allclose(df.values, spec.to_dataframe().values)
-        assert_allclose(df.columns.values, spec.to_dataframe().columns.values)
-        assert_array_equal(df.index.values, spec.to_dataframe().index.values)
-    finally:
-        rmtree(tmp_dir)
+def test_spectrum_to_dataframe_no_copy():
+    amplitudes = np.random.random((2, 10))
+    spec = Spectrum(amplitudes, np.arange(10),
+                    ({'filename': 'a'}, {'filename': 'b'}))
+    df_spec = spec.to_dataframe()
+    assert np.shares_memory(df_spec.values, amplitudes)
+
+
+def test_spectrum_to_csv(spectrum, tmpdir):
+    spec = spectrum
+    filename = str(tmpdir.join('spectra.csv'))
+    spec.to_csv(filename)
+    df = pd.read_csv(filename, index_col=0)
+    df_spec = spec.to_dataframe()
+    # the values themselves are checked in test_spectrum_to_dataframe
+    assert df.shape == df_spec.shape
+    assert_allclose(df.columns.values.astype(float), spec.wavelength)
+    assert_array_equal(df.index.values, df_spec.index.values)
+    assert_allclose(df.values[0], df_spec.values[0])
+
+
+@pytest.mark.parametrize("buffering", [-1, 1024])
+def test_spectrum_to_csv_buffering(buffering, tmpdir):
+    spec = Spectrum(np.random.random((2, 10)), np.arange(10, dtype=float),
+                    ({'filename': 'a'}, {'filename': 'b'}))
+    filename = str(tmpdir.join('spectra.csv'))
+    spec.to_csv(filename, buffering=buffering)
+    spec_csv = specread(filename)
+    assert_allclose(spec_csv.amplitudes, spec.amplitudes)
+    assert_allclose(spec_csv.wavelength, spec.wavelength)
+    assert spec_csv.meta == spec.meta
+
+
+def test_spectrum_to_csv_non_ascii(tmpdir):
+    filenames = (u'\xe9chantillon.spc', u'\u5149\u8c31.spc')
+    spec = Spectrum(np.random.random((2, 10)), np.arange(10, dtype=float),
+                    tuple({'filename': name} for name in filenames))
+    filename = str(tmpdir.join('spectra.csv'))
+    spec.to_csv(filename)
+    # the file is encoded in UTF-8 whatever the locale
+    with open(filename, 'rb') as f:
+        content = f.read().decode('utf-8')
+    assert all(name in content for name in filenames)
+    df = pd.read_csv(filename, index_col=0, encoding='utf-8')
+    assert tuple(df.index.values) == filenames
+    assert_allclose(df.values, spec.amplitudes)
 
 
 def test_util_dict():
@@ -4,11 +4,14 @@
 # Authors: Guillaume Lemaitre <guillaume.lemaitre@inria.fr>
 # License: BSD 3 clause
 
+import io
 import re
 from collections import OrderedDict
 
 import numpy as np
-from six import string_types
+from six import string_types, PY2
+
+_IDENTIFIER_RE = re.compile(r'[a-z_]\w*$', re.I)
 
 
 class Dict(OrderedDict):
@@ -47,7 +50,7 @@ class Dict(OrderedDict):
 
     @staticmethod
     def _isidentifier(val):
-        return bool(re.match(r'[a-z_]\w*$', val, re.I))
+        return _IDENTIFIER_RE.match(val) is not None
 
     def __dir__(self):
         names = [k for k in self.keys() if
@@ -72,6 +75,12 @@ class Spectrum(object):
         The dictionary containing the meta data. When several spectrum have
         been compressed, a tuple of dictionary is returned.
 
+    wavelength_dtype : dtype or None, optional (default=None)
+        The data type in which the wavelength are stored. Use a smaller type
+        (e.g. ``np.float32``) to reduce the memory footprint. Beware that
+        it reduces the precision, which matters when merging spectrum with
+        a small ``tol_wavelength``. By default, the type is kept unchanged.
+
     Notes
     -----
     See :ref:`sphx_glr_auto_examples_plot_spectrum_usage.py`.
@@ -98,7 +107,10 @@ class Spectrum(object):
 
         return amplitudes, wavelength
 
-    def __init__(self, amplitudes, wavelength, meta=None):
+    def __init__(self, amplitudes, wavelength, meta=None,
+                 wavelength_dtype=None):
+        if wavelength_dtype is not None:
+            wavelength = np.asarray(wavelength, dtype=wavelength_dtype)
         self.amplitudes, self.wavelength = \
             self._validate_amplitudes_wavelength(amplitudes, wavelength)
         self.meta = meta if meta is not None else {}
@@ -130,11 +142,12 @@ class Spectrum(object):
             index = [meta['filename'] for meta in self.meta]
         else:
             index = [self.meta['filename']]
-        return pd.DataFrame(np.atleast_2d(self.amplitudes),
-                            index=index,
-                            columns=self.wavelength)
+        # wrap the amplitudes without copying them
+        amplitudes = np.atleast_2d(np.ascontiguousarray(self.amplitudes))
+        return pd.DataFrame(amplitudes, index=index, columns=self.wavelength,
+                            copy=False)
 
-    def to_csv(self, filename):
+    def to_csv(self, filename, buffering=4 * 1024 * 1024):
         """Export the Spectrum into CSV.
 
         Parameters
@@ -142,12 +155,24 @@ class Spectrum(object):
         filename : str
             File path
 
+        buffering : int, optional (default=4 MiB)
+            The size of the write buffer used for the output file. The
+            buffering policy is the same as in the builtin :func:`open`.
+
         Returns
         -------
         None
 
         """
-        self.to_dataframe().to_csv(filename)
+        if PY2:
+            # pandas writes encoded bytes on Python 2
+            with open(filename, 'wb', buffering) as f:
+                self.to_dataframe().to_csv(f, encoding='utf-8')
+            return
+        # pandas handles the line endings itself
+        with io.open(filename, 'w', buffering, encoding='utf-8',
+                     newline='') as f:
+            self.to_dataframe().to_csv(f)
 
     def __len__(self):
         if self.amplitudes.ndim == 1:
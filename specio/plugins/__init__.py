@@ -57,10 +57,18 @@ For the Format.Reader class:
   * Implement ``_close()`` to clean up.
   * Implement ``_get_length()`` to provide a suitable length based on what
     the user expects. Can be ``inf`` for streaming data.
+  * Set ``_streaming = True`` if the length is costly to compute. Iterating
+    over the reader then calls ``_get_data(index)`` until it raises an
+    ``IndexError``, without calling ``_get_length()``.
   * Implement ``_get_data(index)`` to return an array and a meta-data dict.
   * Implement ``_get_meta_data(index)`` to return a meta-data dict. If index
     is None, it should return the 'global' meta-data.
 
+Several files can be read concurrently, e.g. by :func:`.specread` with
+``n_jobs > 1``. Each file gets its own Request and Reader, but a Format
+instance is shared by all the threads: keep the state of a read in the
+Reader rather than in the Format or at the module level.
+
 """
 
 from . import csv
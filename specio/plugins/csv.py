@@ -51,7 +51,7 @@ class CSV(Format):
     """
 
     def _can_read(self, request):
-        if request.filename.lower().endswith(self.extensions):
+        if request.filename_lower.endswith(self.extensions):
             return True
         return False
     # -- reader
@@ -60,7 +60,10 @@ class CSV(Format):
 
         def _read_csv(self, csv_file):
             import pandas as pd
-            df_data = pd.read_csv(self._fp, index_col=0)
+            # the C parser of pandas is used; all columns are numeric, so
+            # parse the file in a single pass instead of by chunks
+            df_data = pd.read_csv(csv_file, index_col=0, engine='c',
+                                  low_memory=False)
             df_data.columns = df_data.columns.astype(float)
             spectrum = df_data.values.squeeze()
             wavelength = df_data.columns.values
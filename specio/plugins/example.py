@@ -51,7 +51,7 @@ class DummyFormat(Format):
         # request.filename: a representation of the source (only for reporting)
         # request.firstbytes: the first 256 bytes of the file.
 
-        if request.filename.lower().endswith(self.extensions):
+        if request.filename_lower.endswith(self.extensions):
             return True
         return False
     # -- reader
@@ -6,6 +6,7 @@
 
 from __future__ import absolute_import, print_function, division
 
+import mmap
 import struct
 from os.path import basename
 
@@ -212,7 +213,7 @@ class FSM(Format):
     """
 
     def _can_read(self, request):
-        if request.filename.lower().endswith(self.extensions):
+        if request.filename_lower.endswith(self.extensions):
             # the 4 first bytes of a fsm file corresponds to PEPE
             if request.firstbytes[:4] == b'PEPE':
                 return True
@@ -236,8 +237,36 @@ class FSM(Format):
                 Return a Spectrum instance.
 
             """
-            content = fsm_file.read()
+            try:
+                # map the file in memory to avoid copying its whole content
+                content = mmap.mmap(fsm_file.fileno(), 0,
+                                    access=mmap.ACCESS_READ)
+            except Exception:
+                content = fsm_file.read()
+            try:
+                return FSM.Reader._decode_fsm(content, fsm_file)
+            finally:
+                if isinstance(content, mmap.mmap):
+                    content.close()
 
+        @staticmethod
+        def _decode_fsm(content, fsm_file):
+            """Decode the content of the fsm file.
+
+            Parameters
+            ----------
+            content : bytes or mmap
+                The content of the fsm file.
+
+            fsm_file : file object
+                The file object in bytes mode.
+
+            Returns
+            -------
+            spectrum : Spectrum
+                Return a Spectrum instance.
+
+            """
             start_byte = 0
             n_bytes = 4
             signature = content[start_byte:start_byte + n_bytes]
@@ -250,7 +279,10 @@ class FSM(Format):
 
             meta = {'signature': signature,
                     'description': description}
-            spectrum = []
+            # the spectra are copied in a single array allocated once the
+            # header giving the number of spectra has been decoded
+            spectrum = None
+            n_spectra = 0
 
             while start_byte + n_bytes < len(content):
                 # read block info
@@ -265,10 +297,28 @@ class FSM(Format):
                     content[start_byte:start_byte + n_bytes])
                 if isinstance(data_extracted, dict):
                     meta.update(data_extracted)
-                else:
-                    spectrum.append(data_extracted)
-
-            spectrum = np.squeeze(spectrum)
+                    continue
+                if spectrum is None:
+                    # do not trust the header beyond the number of blocks the
+                    # remaining content can hold
+                    n_rows = meta.get('n_x', 1) * meta.get('n_y', 1)
+                    max_rows = ((len(content) - start_byte) //
+                                (6 + block_size) + 1)
+                    n_rows = max(1, min(n_rows, max_rows))
+                    spectrum = np.empty((n_rows, data_extracted.size),
+                                        dtype=data_extracted.dtype)
+                if n_spectra == spectrum.shape[0]:
+                    # the header was wrong, grow the array
+                    n_rows = max(1, spectrum.shape[0])
+                    spectrum = np.concatenate(
+                        [spectrum, np.empty((n_rows, spectrum.shape[1]),
+                                            dtype=spectrum.dtype)])
+                spectrum[n_spectra] = data_extracted
+                n_spectra += 1
+
+            if spectrum is None:
+                spectrum = np.empty((0, 0), dtype=np.float32)
+            spectrum = np.squeeze(spectrum[:n_spectra])
             # we add a value such that we include the endpoint
             wavelength = np.arange(meta['z_start'],
                                    meta['z_end'] + meta['z_delta'],
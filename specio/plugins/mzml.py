@@ -27,7 +27,7 @@ class MZML(Format):
     """
 
     def _can_read(self, request):
-        if request.filename.lower().endswith(self.extensions):
+        if request.filename_lower.endswith(self.extensions):
             return True
         return False
     # -- reader
@@ -295,7 +295,7 @@ class SP(Format):
     """
 
     def _can_read(self, request):
-        if request.filename.lower().endswith(self.extensions):
+        if request.filename_lower.endswith(self.extensions):
             # the 4 first bytes of a sp file corresponds to PEPE
             if request.firstbytes[:4] == b'PEPE':
                 return True
@@ -15,7 +15,6 @@ import numpy as np
 from .. import formats
 from ..core import Format
 from ..core.exceptions import VersionError
-from ..core.request import read_n_bytes
 from ..core.util import Spectrum
 
 
@@ -57,9 +56,9 @@ class SPC(Format):
     """
 
     def _can_read(self, request):
-        if request.filename.lower().endswith(self.extensions):
+        if request.filename_lower.endswith(self.extensions):
             # check that the first byte contain a version supported by spc
-            content = read_n_bytes(request.get_file(), 256)
+            content = request.firstbytes
             _, version = struct.unpack('<cc'.encode('utf8'), content[:2])
             if version not in VERSION_SUPPORTED:
                 raise VersionError("The version {} is not yet supported."
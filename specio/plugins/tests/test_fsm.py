@@ -0,0 +1,57 @@
+"""Test the FSM plugin."""
+
+# Copyright (c) 2017
+# Authors: Guillaume Lemaitre <guillaume.lemaitre@inria.fr>
+# License: BSD 3 clause
+
+from io import BytesIO
+from os.path import basename
+
+import pytest
+
+from numpy.testing import assert_allclose
+
+from specio import specread
+from specio.datasets import load_fsm_path
+from specio.plugins import fsm
+
+
+class NamedBytesIO(BytesIO):
+    """In-memory file with a name and without file descriptor."""
+
+    def __init__(self, content, name):
+        super(NamedBytesIO, self).__init__(content)
+        self.name = name
+
+
+@pytest.fixture(scope='module')
+def fsm_spectrum():
+    return specread(load_fsm_path())
+
+
+@pytest.mark.parametrize("n_rows", [0, 1, 10 ** 12])
+def test_fsm_wrong_header(fsm_spectrum, n_rows, monkeypatch):
+    # the number of spectra given in the header is only used to preallocate
+    # the spectra
+    decode_header = fsm.FUNC_DECODE[5100]
+
+    def _decode_wrong_header(data):
+        meta = decode_header(data)
+        meta['n_x'], meta['n_y'] = n_rows, 1
+        return meta
+
+    monkeypatch.setitem(fsm.FUNC_DECODE, 5100, _decode_wrong_header)
+    spec = specread(load_fsm_path())
+    assert spec.amplitudes.shape == fsm_spectrum.amplitudes.shape
+    assert_allclose(spec.amplitudes, fsm_spectrum.amplitudes)
+    assert_allclose(spec.wavelength, fsm_spectrum.wavelength)
+
+
+def test_fsm_no_mmap(fsm_spectrum):
+    # a file object without file descriptor cannot be memory-mapped
+    with open(load_fsm_path(), 'rb') as f:
+        fsm_file = NamedBytesIO(f.read(), load_fsm_path())
+    spec = fsm.FSM.Reader._read_fsm(fsm_file)
+    assert_allclose(spec.amplitudes, fsm_spectrum.amplitudes)
+    assert_allclose(spec.wavelength, fsm_spectrum.wavelength)
+    assert spec.meta['filename'] == basename(load_fsm_path())
@@ -10,6 +10,7 @@ from numpy.testing import assert_allclose
 from numpy.testing import assert_array_equal
 
 from specio import specread
+from specio.cli import main
 
 # we reuse a bit of pytest's own testing machinery, this should eventually come
 # from a separate installable pytest-cli plugin.
@@ -68,17 +69,18 @@ def test_specio_cli_single_spectrum(filename_input, filename_output, run):
     "filename_input, filename_output",
     [(os.path.join(module_data_path, 'spectra.mzml'), None),
      (os.path.join(module_data_path, 'spectra.mzml'), 'spectra')])
-def test_specio_cli_multi_spectra(filename_input, filename_output, run,
+@pytest.mark.parametrize("jobs", ['1', '2'])
+def test_specio_cli_multi_spectra(filename_input, filename_output, jobs, run,
                                   testdir):
     # test when specread return a list of Spectrum instance
     tmp_dir = mkdtemp()
     try:
         if filename_output is None:
-            run("convert", filename_input)
+            run("convert", filename_input, '-j', jobs)
             output_folder = testdir.tmpdir.__str__()
         else:
             filename_output = os.path.join(tmp_dir, filename_output)
-            run("convert", filename_input, '-o', filename_output)
+            run("convert", filename_input, '-o', filename_output, '-j', jobs)
             output_folder = tmp_dir
 
         exported_files = glob.glob(os.path.join(output_folder, '*.csv'))
@@ -86,3 +88,13 @@ def test_specio_cli_multi_spectra(filename_input, filename_output, run,
 
     finally:
         rmtree(tmp_dir)
+
+
+def test_specio_cli_jobs_zero(monkeypatch, capsys):
+    filename_input = os.path.join(module_data_path, 'sp1.spc')
+    monkeypatch.setattr(sys, 'argv',
+                        ['specio', 'convert', filename_input, '-j', '0'])
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+    assert excinfo.value.code == 2
+    assert 'cannot be 0' in capsys.readouterr().err